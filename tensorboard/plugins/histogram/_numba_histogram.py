@@ -0,0 +1,115 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Numba-compiled kernels for computing uniform-width histograms.
+
+Importing this module requires `numba`, which is an optional dependency,
+and raises `ImportError` if it is not installed.
+
+Each kernel splits its input into chunks that are processed in parallel,
+so that each thread reads its chunk once and accumulates into its own
+local state, which is then reduced. The kernels are compiled on first
+call, which takes a while; compiled code is cached on disk to amortize
+this across processes.
+
+The kernels may be called from any thread, but only run one at a time.
+"""
+
+
+import threading
+
+import numba
+import numpy as np
+
+
+# Maximum number of chunks to split data into for parallel processing.
+_MAX_CHUNK_COUNT = 64
+
+# Held while running a parallel kernel. Without TBB or OpenMP, numba falls
+# back to its `workqueue` threading layer, which aborts the process when
+# kernels run concurrently from several threads. Each kernel already uses
+# every core, so serializing them costs little.
+_kernel_lock = threading.Lock()
+
+
+@numba.njit(cache=True)
+def _chunking(size):
+    """Return `(chunk_size, chunk_count)` for splitting `size` values."""
+    chunk_size = -(-size // _MAX_CHUNK_COUNT)
+    return chunk_size, -(-size // chunk_size)
+
+
+def min_max(data):
+    """Compute the minimum and maximum of a non-empty 1D floating point array.
+
+    Like `np.min` and `np.max`, both results are NaN if `data` has NaNs.
+    """
+    with _kernel_lock:
+        return _min_max(data)
+
+
+def bucket_counts(data, min_, max_, bucket_count):
+    """Count values into equal-width buckets spanning `[min_, max_]`.
+
+    This has the same semantics as `summary_v2._count_buckets`, except
+    that it returns an `int64` array.
+    """
+    with _kernel_lock:
+        return _bucket_counts(data, min_, max_, bucket_count)
+
+
+@numba.njit(parallel=True, cache=True)
+def _min_max(data):
+    chunk_size, chunk_count = _chunking(data.size)
+    mins = np.empty(chunk_count)
+    maxs = np.empty(chunk_count)
+    for chunk in numba.prange(chunk_count):
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, data.size)
+        lo = data[start]
+        hi = data[start]
+        for i in range(start + 1, stop):
+            lo = np.minimum(lo, data[i])
+            hi = np.maximum(hi, data[i])
+        mins[chunk] = lo
+        maxs[chunk] = hi
+    # Reduce serially, since parallelized `np.min` does not propagate NaNs.
+    lo = mins[0]
+    hi = maxs[0]
+    for chunk in range(1, chunk_count):
+        lo = np.minimum(lo, mins[chunk])
+        hi = np.maximum(hi, maxs[chunk])
+    return lo, hi
+
+
+@numba.njit(parallel=True, cache=True)
+def _bucket_counts(data, min_, max_, bucket_count):
+    chunk_size, chunk_count = _chunking(data.size)
+    inv_width = bucket_count / (max_ - min_)
+    counts = np.zeros((chunk_count, bucket_count), dtype=np.int64)
+    for chunk in numba.prange(chunk_count):
+        start = chunk * chunk_size
+        stop = min(start + chunk_size, data.size)
+        for i in range(start, stop):
+            offset = (data[i] - min_) * inv_width
+            # Compare as floats before casting, so that NaNs (for which both
+            # comparisons are false) can't produce an out-of-range index.
+            if offset >= bucket_count - 1:
+                index = bucket_count - 1
+            elif offset >= 0:
+                index = int(offset)
+            else:
+                index = 0
+            counts[chunk, index] += 1
+    return np.sum(counts, axis=0)
@@ -0,0 +1,99 @@
+# Copyright 2021 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the `numba` histogram kernels."""
+
+
+import threading
+
+import numpy as np
+
+from tensorboard import test as tb_test
+
+try:
+    from tensorboard.plugins.histogram import _numba_histogram
+except ImportError:
+    _numba_histogram = None
+
+
+class NumbaHistogramTest(tb_test.TestCase):
+    def setUp(self):
+        super(NumbaHistogramTest, self).setUp()
+        if _numba_histogram is None:
+            self.skipTest("numba not installed")
+        np.random.seed(0)
+        # More values than chunks, with a partial last chunk.
+        self.data = np.random.normal(size=[10007])
+
+    def test_min_max(self):
+        for dtype in (np.float32, np.float64):
+            with self.subTest(dtype=dtype):
+                data = self.data.astype(dtype)
+                min_, max_ = _numba_histogram.min_max(data)
+                self.assertEqual(min_, data.min())
+                self.assertEqual(max_, data.max())
+
+    def test_min_max_of_fewer_values_than_chunks(self):
+        min_, max_ = _numba_histogram.min_max(np.array([3.0, -1.0, 2.0]))
+        self.assertEqual(min_, -1.0)
+        self.assertEqual(max_, 3.0)
+
+    def test_min_max_with_nan(self):
+        self.data[5000] = np.nan
+        min_, max_ = _numba_histogram.min_max(self.data)
+        self.assertTrue(np.isnan(min_))
+        self.assertTrue(np.isnan(max_))
+
+    def test_bucket_counts(self):
+        for dtype in (np.float32, np.float64):
+            with self.subTest(dtype=dtype):
+                data = self.data.astype(dtype)
+                counts = _numba_histogram.bucket_counts(
+                    data, float(data.min()), float(data.max()), 13
+                )
+                self.assertEqual(counts.dtype, np.int64)
+                expected, _ = np.histogram(data.astype(np.float64), bins=13)
+                np.testing.assert_array_equal(counts, expected)
+
+    def test_bucket_counts_includes_max_in_last_bucket(self):
+        data = np.arange(17, dtype=np.float64)
+        counts = _numba_histogram.bucket_counts(data, 0.0, 16.0, 4)
+        np.testing.assert_array_equal(counts, [4, 4, 4, 5])
+
+    def test_bucket_counts_with_nan(self):
+        self.data[5000] = np.nan
+        counts = _numba_histogram.bucket_counts(self.data, -1.0, 1.0, 4)
+        self.assertEqual(counts.sum(), self.data.size)
+
+    def test_concurrent_calls(self):
+        expected = _numba_histogram.bucket_counts(self.data, -1.0, 1.0, 4)
+        results = [None] * 4
+
+        def count(i):
+            results[i] = _numba_histogram.bucket_counts(self.data, -1.0, 1.0, 4)
+
+        threads = [
+            threading.Thread(target=count, args=(i,))
+            for i in range(len(results))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for result in results:
+            np.testing.assert_array_equal(result, expected)
+
+
+if __name__ == "__main__":
+    tb_test.main()
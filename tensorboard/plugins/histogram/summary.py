@@ -81,11 +81,12 @@ def _buckets(data, bucket_count=None):
                     tf.floor(offsets / bucket_width), dtype=tf.int32
                 )
                 clamped_indices = tf.minimum(bucket_indices, bucket_count - 1)
-                # Use float64 instead of float32 to avoid accumulating floating point error
-                # later in tf.reduce_sum when summing more than 2^24 individual `1.0` values.
+                # Use int32 instead of float32 to avoid accumulating floating point error
+                # later in tf.reduce_sum when summing more than 2^24 individual `1.0` values,
+                # and instead of float64 to halve the size of the one-hot matrix.
                 # See https://github.com/tensorflow/tensorflow/issues/51419 for details.
                 one_hots = tf.one_hot(
-                    clamped_indices, depth=bucket_count, dtype=tf.float64
+                    clamped_indices, depth=bucket_count, dtype=tf.int32
                 )
                 bucket_counts = tf.cast(
                     tf.reduce_sum(input_tensor=one_hots, axis=0),
@@ -211,11 +212,13 @@ def pb(name, data, bucket_count=None, display_name=None, description=None):
             )
             bucket_counts = np.sum(one_hots, axis=0)
             edges = np.linspace(min_, max_, bucket_count + 1)
-            left_edges = edges[:-1]
-            right_edges = edges[1:]
-            buckets = np.array(
-                [left_edges, right_edges, bucket_counts]
-            ).transpose()
+            # Fill a row-major buffer column by column, rather than
+            # transposing a `[3, k]` array, which would need another copy
+            # to become contiguous when converted to a tensor proto.
+            buckets = np.empty((bucket_count, 3), dtype=np.float64)
+            buckets[:, 0] = edges[:-1]
+            buckets[:, 1] = edges[1:]
+            buckets[:, 2] = bucket_counts
     tensor = tf.make_tensor_proto(buckets, dtype=tf.float64)
 
     if display_name is None:
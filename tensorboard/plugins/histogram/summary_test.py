@@ -18,6 +18,7 @@
 
 import glob
 import os
+from unittest import mock
 
 import numpy as np
 import tensorflow as tf
@@ -26,6 +27,7 @@ from tensorboard.compat import tf2
 from tensorboard.compat.proto import summary_pb2
 from tensorboard.plugins.histogram import metadata
 from tensorboard.plugins.histogram import summary
+from tensorboard.plugins.histogram import summary_v2
 from tensorboard.util import tensor_util
 
 
@@ -41,6 +43,22 @@ except AttributeError:
     pass
 
 
+def _fake_fast_histogram1d(x, bins, range):
+    """Stand-in for `fast_histogram.histogram1d`, which may not be installed.
+
+    Like the real function, this rejects a non-finite range and treats the
+    range as half-open.
+    """
+    xmin, xmax = range
+    if not np.isfinite(xmin):
+        raise ValueError("xmin should be finite")
+    if not np.isfinite(xmax):
+        raise ValueError("xmax should be finite")
+    in_range = x[(x >= xmin) & (x < xmax)]
+    counts, _ = np.histogram(in_range, bins=bins, range=range)
+    return counts.astype(np.float64)
+
+
 class SummaryBaseTest(object):
     def setUp(self):
         super(SummaryBaseTest, self).setUp()
@@ -96,6 +114,23 @@ class SummaryBaseTest(object):
         self.assertEqual(buckets[:, 2].sum(), self.gaussian.size)
         np.testing.assert_allclose(buckets[1:, 0], buckets[:-1, 1])
 
+    def test_float32_input(self):
+        data = self.gaussian.astype(np.float32)
+        pb = self.histogram("float32", data=data, buckets=20)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        self.assertEqual(buckets.dtype, np.float64)
+        self.assertEqual(buckets[:, 0].min(), data.min())
+        self.assertNear(buckets[:, 1].max(), data.max(), 1e-10)
+        self.assertEqual(buckets[:, 2].sum(), data.size)
+
+    def test_float32_input_with_range_wider_than_float32(self):
+        # The difference between the extrema overflows `float32`.
+        data = np.array([-3e38, 0.5e38, 3e38], dtype=np.float32)
+        pb = self.histogram("wide", data=data, buckets=30)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        expected, _ = np.histogram(data.astype(np.float64), bins=30)
+        np.testing.assert_array_equal(buckets[:, 2], expected)
+
     def test_when_shape_not_statically_known(self):
         self.skipTest("TODO: figure out how to test this")
         placeholder = tf.compat.v1.placeholder(tf.float64, shape=None)
@@ -175,6 +210,62 @@ class SummaryV2PbTest(SummaryBaseTest, tf.test.TestCase):
     def histogram(self, *args, **kwargs):
         return summary.histogram_pb(*args, **kwargs)
 
+    def test_large_input_includes_max_in_last_bucket(self):
+        # Large enough to take the `numba` or `fast_histogram` path, if
+        # either is installed.
+        data = np.arange(2**14 + 1, dtype=float)
+        self.assertGreaterEqual(data.size, summary_v2._ACCELERATED_MIN_SIZE)
+        pb = self.histogram("large", data=data, buckets=4)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        self.assertEqual(buckets[-1][1], data.max())
+        np.testing.assert_array_equal(buckets[:, 2], [4096, 4096, 4096, 4097])
+
+    def test_large_input_without_accelerators(self):
+        # Several chunks, the last of them partial.
+        size = 2 * summary_v2._CHUNK_SIZE + 123
+        with mock.patch.object(
+            summary_v2, "_import_numba_histogram", lambda: None
+        ), mock.patch.object(summary_v2, "_fast_histogram1d", None):
+            for dtype in (np.float32, np.float64):
+                with self.subTest(dtype=dtype):
+                    data = np.random.normal(size=[size]).astype(dtype)
+                    pb = self.histogram("large", data=data, buckets=13)
+                    buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+                    self.assertEqual(buckets[0][0], data.min())
+                    self.assertEqual(buckets[-1][1], data.max())
+                    expected, _ = np.histogram(data.astype(np.float64), bins=13)
+                    np.testing.assert_array_equal(buckets[:, 2], expected)
+
+    def histogram_with_fast_histogram(self, *args, **kwargs):
+        fast_histogram1d = mock.Mock(side_effect=_fake_fast_histogram1d)
+        with mock.patch.object(
+            summary_v2, "_import_numba_histogram", lambda: None
+        ), mock.patch.object(summary_v2, "_fast_histogram1d", fast_histogram1d):
+            pb = self.histogram(*args, **kwargs)
+        return (pb, fast_histogram1d)
+
+    def test_fast_histogram(self):
+        data = np.arange(2**14 + 1, dtype=float)
+        pb, fast_histogram1d = self.histogram_with_fast_histogram(
+            "large", data=data, buckets=4
+        )
+        fast_histogram1d.assert_called_once()
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        self.assertEqual(buckets[-1][1], data.max())
+        np.testing.assert_array_equal(buckets[:, 2], [4096, 4096, 4096, 4097])
+
+    def test_fast_histogram_with_non_finite_values(self):
+        for value in (np.nan, np.inf, -np.inf):
+            with self.subTest(value=value):
+                data = np.arange(20000, dtype=float)
+                data[123] = value
+                pb, fast_histogram1d = self.histogram_with_fast_histogram(
+                    "non_finite", data=data, buckets=4
+                )
+                fast_histogram1d.assert_not_called()
+                buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+                self.assertEqual(buckets[:, 2].sum(), data.size)
+
 
 class SummaryV2OpTest(SummaryBaseTest, tf.test.TestCase):
     def setUp(self):
@@ -216,6 +307,102 @@ class SummaryV2OpTest(SummaryBaseTest, tf.test.TestCase):
         event = self.histogram_event("a", [], step=333)
         self.assertEqual(333, event.step)
 
+    def test_bool_bucket_count(self):
+        with self.assertRaises(TypeError):
+            self.write_histogram_event("a", [1.0, 2.0], buckets=True)
+
+    def test_bucket_count_out_of_int32_range(self):
+        with self.assertRaisesRegex(ValueError, "out of range for int32"):
+            self.write_histogram_event("a", [1.0, 2.0], buckets=2**31)
+
+    def test_axis(self):
+        data = np.array([[0.0, 1.0, 2.0, 3.0], [7.0, 7.0, 7.0, 7.0]])
+        # Slice along the last axis of the transpose to exercise the reshape.
+        self.write_histogram_event("a", data.T, buckets=2, axis=-1)
+        event_files = glob.glob(os.path.join(self.get_temp_dir(), "*"))
+        self.assertEqual(len(event_files), 1)
+        events = list(tf.compat.v1.train.summary_iterator(event_files[0]))
+        os.remove(event_files[0])
+        values = [event.summary.value[0] for event in events[1:]]
+        self.assertEqual(["a/0", "a/1"], [value.tag for value in values])
+        np.testing.assert_allclose(
+            tensor_util.make_ndarray(values[0].tensor),
+            np.array([[0.0, 1.5, 2], [1.5, 3.0, 2]]),
+        )
+        np.testing.assert_allclose(
+            tensor_util.make_ndarray(values[1].tensor),
+            np.array([[6.5, 7.5, 4]]),
+        )
+
+    def test_axis_out_of_range(self):
+        data = np.zeros([2, 3])
+        for axis in (2, -3):
+            with self.subTest(axis=axis):
+                with self.assertRaisesRegex(ValueError, "out of range"):
+                    self.write_histogram_event("a", data, axis=axis)
+
+    def test_axis_with_scalar_data(self):
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            self.write_histogram_event("a", 1.0, axis=0)
+
+    def test_axis_with_no_slices(self):
+        self.write_histogram_event("a", np.zeros([0, 5]), axis=0)
+        event_files = glob.glob(os.path.join(self.get_temp_dir(), "*"))
+        self.assertEqual(len(event_files), 1)
+        events = list(tf.compat.v1.train.summary_iterator(event_files[0]))
+        os.remove(event_files[0])
+        # Expect only the boilerplate event for the file_version.
+        self.assertEqual(len(events), 1)
+
+    def test_not_recording(self):
+        with tf2.summary.record_if(False):
+            self.write_histogram_event("a", [1.0, 2.0])
+        event_files = glob.glob(os.path.join(self.get_temp_dir(), "*"))
+        self.assertEqual(len(event_files), 1)
+        events = list(tf.compat.v1.train.summary_iterator(event_files[0]))
+        os.remove(event_files[0])
+        # Expect only the boilerplate event for the file_version.
+        self.assertEqual(len(events), 1)
+
+    def test_non_finite_input(self):
+        for value in (np.nan, np.inf, -np.inf):
+            with self.subTest(value=value):
+                # Not first or last, where a reduction that ignores NaNs
+                # could still pick it up.
+                data = np.array([1.0, value, 2.0, 3.0])
+                pb = self.histogram("non_finite", data=data, buckets=4)
+                buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+                self.assertEqual(buckets[:, 2].sum(), data.size)
+
+    def test_large_input(self):
+        # Large enough for the helpers to be compiled with XLA.
+        data = np.arange(summary_v2._JIT_MIN_SIZE + 1, dtype=float)
+        pb = self.histogram("large", data=data, buckets=4)
+        buckets = tensor_util.make_ndarray(pb.value[0].tensor)
+        quarter = summary_v2._JIT_MIN_SIZE // 4
+        self.assertEqual(buckets[-1][1], data.max())
+        np.testing.assert_array_equal(
+            buckets[:, 2], [quarter, quarter, quarter, quarter + 1]
+        )
+
+    def test_large_input_with_axis(self):
+        # Large enough in total for the helpers to be compiled with XLA.
+        row = np.arange(summary_v2._JIT_MIN_SIZE // 2 + 1, dtype=float)
+        data = np.stack([row, -row])
+        self.write_histogram_event("a", data, buckets=4, axis=0)
+        event_files = glob.glob(os.path.join(self.get_temp_dir(), "*"))
+        self.assertEqual(len(event_files), 1)
+        events = list(tf.compat.v1.train.summary_iterator(event_files[0]))
+        os.remove(event_files[0])
+        values = [event.summary.value[0] for event in events[1:]]
+        self.assertEqual(["a/0", "a/1"], [value.tag for value in values])
+        eighth = summary_v2._JIT_MIN_SIZE // 8
+        for value in values:
+            buckets = tensor_util.make_ndarray(value.tensor)
+            np.testing.assert_array_equal(
+                buckets[:, 2], [eighth, eighth, eighth, eighth + 1]
+            )
+
     def test_default_step(self):
         try:
             tf2.summary.experimental.set_step(333)
@@ -263,6 +450,24 @@ class SummaryV2OpGraphTest(SummaryV2OpTest, tf.test.TestCase):
         with writer.as_default():
             graph_fn.get_concrete_function()
 
+    def test_no_gradient_error_xla_with_list_of_tensors(self):
+        @tf2.function(jit_compile=True)
+        def graph_fn():
+            x = tf.constant(1.0)
+            with tf2.GradientTape() as tape1:
+                with tf2.GradientTape() as tape2:
+                    tape1.watch(x)
+                    tape2.watch(x)
+                    summary.histogram(
+                        name="loss", step=0, data=[x, x], buckets=10
+                    )
+
+        # See `test_no_gradient_error_xla` for why this stops at graph
+        # building.
+        writer = tf2.summary.create_file_writer(self.get_temp_dir())
+        with writer.as_default():
+            graph_fn.get_concrete_function()
+
 
 if __name__ == "__main__":
     tf.test.main()
@@ -26,6 +26,7 @@ endpoints are the same (the shape is `[1, 3]`).
 """
 
 import contextlib
+import functools
 
 import numpy as np
 
@@ -35,11 +36,33 @@ from tensorboard.plugins.histogram import metadata
 from tensorboard.util import lazy_tensor_creator
 from tensorboard.util import tensor_util
 
+try:
+    from fast_histogram import histogram1d as _fast_histogram1d
+except ImportError:
+    _fast_histogram1d = None
+
 
 DEFAULT_BUCKET_COUNT = 30
 
+# Minimum number of values for which `histogram_pb` uses compiled kernels
+# from `numba` or `fast_histogram` (when installed); below this, their call
+# overhead outweighs the savings.
+_ACCELERATED_MIN_SIZE = 10000
+
+# Number of values that the NumPy code in `histogram_pb` processes at a
+# time. At 256 KiB of `float64`s, a chunk stays in L2 cache across the
+# several passes made over it.
+_CHUNK_SIZE = 32768
+
+# Minimum number of values for which `histogram` compiles its helpers with
+# XLA. XLA compiles once per distinct input shape, which takes far longer
+# than a pass over a small tensor, so smaller data (such as most of the
+# weights logged by a Keras `TensorBoard` callback) is processed by
+# uncompiled ops instead.
+_JIT_MIN_SIZE = 2**20
 
-def histogram(name, data, step=None, buckets=None, description=None):
+
+def histogram(name, data, step=None, buckets=None, description=None, axis=None):
     """Write a histogram summary.
 
     See also `tf.summary.scalar`, `tf.summary.SummaryWriter`.
@@ -51,7 +74,7 @@ def histogram(name, data, step=None, buckets=None, description=None):
     with the same `name` constitute a time series of histograms.
 
     The histogram is calculated over all the elements of the given `Tensor`
-    without regard to its shape or rank.
+    without regard to its shape or rank, unless `axis` is given.
 
     This example writes 2 histograms:
 
@@ -81,6 +104,14 @@ def histogram(name, data, step=None, buckets=None, description=None):
         tf.summary.histogram("layer3/activate", activations[2], step=step)
     ```
 
+    When such activations are stacked into a single `Tensor`, passing `axis`
+    computes all of their histograms at once, writing them under the tags
+    "activate/0", "activate/1", and "activate/2":
+
+    ```python
+        tf.summary.histogram("activate", tf.stack(activations), step=step, axis=0)
+    ```
+
     Arguments:
       name: A name for this summary. The summary tag used for TensorBoard will
         be this name prefixed by any active name scopes.
@@ -96,6 +127,10 @@ def histogram(name, data, step=None, buckets=None, description=None):
         endpoints are the same.
       description: Optional long-form description for this summary, as a
         constant `str`. Markdown is supported. Defaults to empty.
+      axis: Optional `int`. If given, a separate histogram is computed over
+        each slice of `data` along this axis, whose size must be statically
+        known, and the histogram for the `i`th slice is written with the
+        tag of this summary suffixed by `/i`.
 
     Returns:
       True on success, or false if no summary was emitted because no default
@@ -103,20 +138,34 @@ def histogram(name, data, step=None, buckets=None, description=None):
 
     Raises:
       ValueError: if a default writer exists, but no step was provided and
-        `tf.summary.experimental.get_step()` is None.
+        `tf.summary.experimental.get_step()` is None; or if `axis` is given
+        but is out of range for the rank of `data`, or that rank or the size
+        of `data` along `axis` is not statically known.
     """
-    # Avoid building unused gradient graphs for conds below. This works around
-    # an error building second-order gradient graphs when XlaDynamicUpdateSlice
-    # is used, and will generally speed up graph building slightly.
-    data = tf.stop_gradient(data)
+    # When executing eagerly, whether summaries are recorded is known now, so
+    # skip all of the setup below on steps that won't record them. In graph
+    # mode, this is decided when the graph runs, by the conds below.
+    if tf.executing_eagerly() and not bool(
+        tf.summary.should_record_summaries()
+    ):
+        return tf.constant(False)
+    if isinstance(data, (np.ndarray, np.generic, int, float)):
+        # NumPy values and Python scalars can't be watched by a gradient
+        # tape, so converting them suffices and saves an identity op.
+        data = tf.convert_to_tensor(data)
+    else:
+        # Avoid building unused gradient graphs for conds below. This works
+        # around an error building second-order gradient graphs when
+        # XlaDynamicUpdateSlice is used, and will generally speed up graph
+        # building slightly. This includes lists of tensors, whose conversion
+        # to a tensor is recorded by gradient tapes.
+        data = tf.stop_gradient(data)
+    if axis is not None:
+        data = _slices_as_rows(data, axis)
     summary_metadata = metadata.create_summary_metadata(
         display_name=None, description=description
     )
-    # TODO(https://github.com/tensorflow/tensorboard/issues/2109): remove fallback
-    summary_scope = (
-        getattr(tf.summary.experimental, "summary_scope", None)
-        or tf.summary.summary_scope
-    )
+    summary_scope = _summary_scope()
 
     # Try to capture current name scope so we can re-enter it below within our
     # histogram_summary helper. We do this to avoid having the `tf.cond` below
@@ -143,13 +192,18 @@ def histogram(name, data, step=None, buckets=None, description=None):
             with summary_scope(
                 name, "histogram_summary", values=[data, buckets, step]
             ) as (tag, _):
+                if axis is not None:
+                    return _write_batched(
+                        tag, data, buckets, summary_metadata, step
+                    )
+
                 # Defer histogram bucketing logic by passing it as a callable to
                 # write(), wrapped in a LazyTensorCreator for backwards
                 # compatibility, so that we only do this work when summaries are
                 # actually written.
                 @lazy_tensor_creator.LazyTensorCreator
                 def lazy_tensor():
-                    return _buckets(data, buckets)
+                    return _stack_buckets(_buckets(data, buckets))
 
                 return tf.summary.write(
                     tag=tag,
@@ -178,60 +232,124 @@ def histogram(name, data, step=None, buckets=None, description=None):
     return histogram_summary(data, buckets, summary_metadata, step)
 
 
+@functools.lru_cache(maxsize=None)
+def _summary_scope():
+    """Look up the `summary_scope` API once, rather than on every call."""
+    # TODO(https://github.com/tensorflow/tensorboard/issues/2109): remove fallback
+    return (
+        getattr(tf.summary.experimental, "summary_scope", None)
+        or tf.summary.summary_scope
+    )
+
+
+def _slices_as_rows(data, axis):
+    """Reshape a `Tensor` into one row per slice along the given axis.
+
+    Arguments:
+      data: A `Tensor` of statically known rank, with a statically known size
+        along `axis`.
+      axis: An `int` axis of `data`.
+
+    Returns:
+      A 2D `Tensor` whose `i`th row holds the elements of the `i`th slice of
+      `data` along `axis`.
+
+    Raises:
+      ValueError: if the rank of `data` or its size along `axis` is not
+        statically known, or `axis` is out of range for that rank.
+    """
+    rank = data.shape.rank
+    if rank is None:
+        raise ValueError("Rank of data must be statically known with axis")
+    if not -rank <= axis < rank:
+        raise ValueError(
+            "Axis %d is out of range for data of rank %d" % (axis, rank)
+        )
+    axis %= rank
+    if data.shape[axis] is None:
+        raise ValueError(
+            "Size of data along axis %d must be statically known" % axis
+        )
+    if data.shape[axis] == 0:
+        # `tf.reshape` can't infer the size of the other dimension below
+        # when there are no slices, but there is nothing to infer.
+        return tf.reshape(data, [0, 0])
+    perm = [axis] + [i for i in range(rank) if i != axis]
+    return tf.reshape(tf.transpose(a=data, perm=perm), [data.shape[axis], -1])
+
+
+def _write_batched(tag, data, buckets, summary_metadata, step):
+    """Write a histogram summary for each row of a 2D `Tensor`.
+
+    The histograms are bucketed together, so this is only done when
+    summaries are actually being recorded.
+
+    Arguments:
+      tag: The tag prefix for the summaries.
+      data: A 2D `Tensor` with a statically known number of rows.
+      buckets: Optional positive `int` or scalar `int32` `Tensor`.
+      summary_metadata: The `SummaryMetadata` for each summary.
+      step: The step value for the summaries.
+
+    Returns:
+      True on success, or false if no summary was emitted.
+    """
+
+    def write_rows():
+        results = [
+            tf.summary.write(
+                tag="%s/%d" % (tag, i),
+                tensor=_stack_buckets(row_buckets),
+                step=step,
+                metadata=summary_metadata,
+            )
+            for (i, row_buckets) in enumerate(_batched_buckets(data, buckets))
+        ]
+        return tf.reduce_all(input_tensor=tf.stack(results))
+
+    if not data.shape[0]:
+        return tf.constant(False)
+    return tf.cond(
+        tf.summary.should_record_summaries(), write_rows, lambda: False
+    )
+
+
 def _buckets(data, bucket_count=None):
-    """Create a TensorFlow op to group data into histogram buckets.
+    """Create TensorFlow ops to group data into histogram buckets.
+
+    The buckets are returned as separate edge and count vectors; use
+    `_stack_buckets` to interleave them into the summary tensor format.
 
     Arguments:
       data: A `Tensor` of any shape. Must be castable to `float64`.
       bucket_count: Optional positive `int` or scalar `int32` `Tensor`.
     Returns:
-      A `Tensor` of shape `[k, 3]` and type `float64`. The `i`th row is
-      a triple `[left_edge, right_edge, count]` for a single bucket.
+      A tuple `(left_edges, right_edges, counts)` of `Tensor`s of shape
+      `[k]` and type `float64`, each holding one value per bucket.
       The value of `k` is either `bucket_count` or `1` or `0`.
     """
     if bucket_count is None:
         bucket_count = DEFAULT_BUCKET_COUNT
     with tf.name_scope("buckets"):
-        tf.debugging.assert_scalar(bucket_count)
-        tf.debugging.assert_type(bucket_count, tf.int32)
+        _check_bucket_count(bucket_count)
         data = tf.reshape(data, shape=[-1])  # flatten
-        data = tf.cast(data, tf.float64)
-        is_empty = tf.equal(tf.size(input=data), 0)
+        data = _cast_for_bucketing(data)
+        # When the size of `data` is statically known, resolve the edge cases
+        # that depend on it now rather than building conds for them.
+        static_size = data.shape.num_elements()
 
         def when_empty():
-            return tf.constant([], shape=(0, 3), dtype=tf.float64)
+            empty = tf.constant([], dtype=tf.float64)
+            return (empty, empty, empty)
 
         def when_nonempty():
-            min_ = tf.reduce_min(input_tensor=data)
-            max_ = tf.reduce_max(input_tensor=data)
+            min_, max_ = _reduce_min_max(data)
             range_ = max_ - min_
             is_singular = tf.equal(range_, 0)
 
             def when_nonsingular():
-                bucket_width = range_ / tf.cast(bucket_count, tf.float64)
-                offsets = data - min_
-                bucket_indices = tf.cast(
-                    tf.floor(offsets / bucket_width), dtype=tf.int32
-                )
-                clamped_indices = tf.minimum(bucket_indices, bucket_count - 1)
-                # Use float64 instead of float32 to avoid accumulating floating point error
-                # later in tf.reduce_sum when summing more than 2^24 individual `1.0` values.
-                # See https://github.com/tensorflow/tensorflow/issues/51419 for details.
-                one_hots = tf.one_hot(
-                    clamped_indices, depth=bucket_count, dtype=tf.float64
-                )
-                bucket_counts = tf.cast(
-                    tf.reduce_sum(input_tensor=one_hots, axis=0),
-                    dtype=tf.float64,
-                )
-                edges = tf.linspace(min_, max_, bucket_count + 1)
-                # Ensure edges[-1] == max_, which TF's linspace implementation does not
-                # do, leaving it subject to the whim of floating point rounding error.
-                edges = tf.concat([edges[:-1], [max_]], 0)
-                left_edges = edges[:-1]
-                right_edges = edges[1:]
-                return tf.transpose(
-                    a=tf.stack([left_edges, right_edges, bucket_counts])
+                return _nonsingular_buckets(
+                    data, min_, max_, range_, bucket_count
                 )
 
             def when_singular():
@@ -241,15 +359,338 @@ def _buckets(data, bucket_count=None):
                 bucket_counts = tf.stack(
                     [tf.cast(tf.size(input=data), tf.float64)]
                 )
-                return tf.transpose(
-                    a=tf.stack([bucket_starts, bucket_ends, bucket_counts])
-                )
+                return (bucket_starts, bucket_ends, bucket_counts)
 
+            if static_size == 1:
+                return when_singular()
             return tf.cond(is_singular, when_singular, when_nonsingular)
 
+        if static_size is not None:
+            return when_empty() if static_size == 0 else when_nonempty()
+        is_empty = tf.equal(tf.size(input=data), 0)
+        return tf.cond(is_empty, when_empty, when_nonempty)
+
+
+def _batched_buckets(data, bucket_count=None):
+    """Create TensorFlow ops to group each row of data into histogram buckets.
+
+    Arguments:
+      data: A 2D `Tensor` with a statically known number of rows. Must be
+        castable to `float64`.
+      bucket_count: Optional positive `int` or scalar `int32` `Tensor`.
+    Returns:
+      A list with one tuple per row of `data`, as `_buckets` would return
+      for that row alone.
+    """
+    if bucket_count is None:
+        bucket_count = DEFAULT_BUCKET_COUNT
+    with tf.name_scope("buckets"):
+        _check_bucket_count(bucket_count)
+        data = _cast_for_bucketing(data)
+        row_count = data.shape[0]
+        row_size = data.shape[1]
+
+        def when_empty():
+            empty = tf.constant([], dtype=tf.float64)
+            return [(empty, empty, empty)] * row_count
+
+        def when_nonempty():
+            min_, max_ = _reduce_min_max(data)
+            size = tf.cast(tf.shape(input=data)[1], tf.float64)
+
+            def singular(i):
+                center = min_[i : i + 1]
+                return (center - 0.5, center + 0.5, tf.stack([size]))
+
+            if row_size == 1:
+                # Every row holds a single value, and so is singular.
+                return [singular(i) for i in range(row_count)]
+            range_ = max_ - min_
+            is_singular = tf.equal(range_, 0)
+            # Bucket all rows together, substituting a unit range for rows
+            # whose values are all equal so that they don't produce NaNs.
+            # Those rows are given a singular bucket below instead.
+            left_edges, right_edges, bucket_counts = _nonsingular_buckets(
+                data,
+                min_,
+                max_,
+                tf.where(is_singular, tf.ones_like(range_), range_),
+                bucket_count,
+            )
+            return [
+                tf.cond(
+                    is_singular[i],
+                    lambda i=i: singular(i),
+                    lambda i=i: (
+                        left_edges[i],
+                        right_edges[i],
+                        bucket_counts[i],
+                    ),
+                )
+                for i in range(row_count)
+            ]
+
+        if row_size is not None:
+            return when_empty() if row_size == 0 else when_nonempty()
+        is_empty = tf.equal(tf.size(input=data), 0)
         return tf.cond(is_empty, when_empty, when_nonempty)
 
 
+def _cast_for_bucketing(data):
+    """Cast data to the floating point type to compute bucket indices in.
+
+    Single and half precision data is bucketed in `float32` rather than
+    `float64`, which halves the memory traffic of each pass over it. Only
+    the per-histogram extrema are widened to `float64`, to compute the
+    bucket edges.
+    """
+    if data.dtype in (tf.float16, tf.bfloat16, tf.float32):
+        return tf.cast(data, tf.float32)
+    return tf.cast(data, tf.float64)
+
+
+def _check_bucket_count(bucket_count):
+    """Assert that a bucket count is a scalar `int32`.
+
+    A Python `int` is checked here rather than by assertion ops, which
+    would otherwise be added to the graph and run every step.
+
+    Raises:
+      TypeError: if `bucket_count` is a `bool`.
+      ValueError: if `bucket_count` is an `int` outside the `int32` range.
+    """
+    if isinstance(bucket_count, bool):
+        raise TypeError("Bucket count must be an int32, not a bool")
+    if isinstance(bucket_count, int):
+        int32 = np.iinfo(np.int32)
+        if not int32.min <= bucket_count <= int32.max:
+            raise ValueError(
+                "Bucket count %d is out of range for int32" % bucket_count
+            )
+    else:
+        tf.debugging.assert_scalar(bucket_count)
+        tf.debugging.assert_type(bucket_count, tf.int32)
+
+
+def _nonsingular_buckets(data, min_, max_, range_, bucket_count):
+    """Group data into equal-width histogram buckets along its last axis.
+
+    Arguments:
+      data: A non-empty `Tensor` of type `float32` or `float64`.
+      min_: The `float64` minimum of `data` along its last axis.
+      max_: The `float64` maximum of `data` along its last axis.
+      range_: The (nonzero) difference between `max_` and `min_`.
+      bucket_count: Positive `int` or scalar `int32` `Tensor`.
+    Returns:
+      A tuple `(left_edges, right_edges, counts)` of `float64` `Tensor`s of
+      shape `data.shape[:-1] + [bucket_count]`.
+    """
+
+    def count(data):
+        if data.shape.rank != 1:
+            return _bucket_counts(data, min_, range_, bucket_count)
+        # `tf.histogram_fixed_width` rejects a NaN range, and casts NaN bucket
+        # indices to integers unchecked, so leave non-finite data and ranges
+        # to `_bucket_counts`, which clamps them. Check `data` itself, since
+        # `tf.reduce_min` and `tf.reduce_max` need not propagate NaNs.
+        is_finite = tf.logical_and(
+            tf.math.is_finite(range_),
+            tf.reduce_all(input_tensor=tf.math.is_finite(data)),
+        )
+        return tf.cond(
+            is_finite,
+            lambda: _histogram_fixed_width(data, min_, max_, bucket_count),
+            lambda: _bucket_counts(data, min_, range_, bucket_count),
+        )
+
+    if data.dtype == tf.float64:
+        bucket_counts = count(data)
+    else:
+        # Offsets from `min_` overflow `float32` when the range is wider than
+        # its maximum, so compute them in `float64` then.
+        overflows = tf.reduce_any(
+            input_tensor=range_ > float(np.finfo(np.float32).max)
+        )
+        bucket_counts = tf.cond(
+            overflows,
+            lambda: count(tf.cast(data, tf.float64)),
+            lambda: count(data),
+        )
+    bucket_width = range_ / tf.cast(bucket_count, tf.float64)
+    bucket_indices = tf.cast(tf.range(bucket_count), tf.float64)
+    left_edges = (
+        min_[..., tf.newaxis] + bucket_width[..., tf.newaxis] * bucket_indices
+    )
+    # Take each right edge from the next bucket's left edge, and the last
+    # one from `max_` directly, so that it is not subject to the whim of
+    # floating point rounding error.
+    right_edges = tf.concat([left_edges[..., 1:], max_[..., tf.newaxis]], -1)
+    return (left_edges, right_edges, bucket_counts)
+
+
+def _stack_buckets(buckets):
+    """Interleave bucket edges and counts into the summary tensor format.
+
+    Arguments:
+      buckets: A tuple `(left_edges, right_edges, counts)` of 1D `Tensor`s,
+        as returned by `_buckets`.
+    Returns:
+      A `Tensor` of shape `[k, 3]` and type `float64`. The `i`th row is
+      a triple `[left_edge, right_edge, count]` for a single bucket.
+    """
+    return tf.stack(buckets, axis=1)
+
+
+def _lazy_jit_function(**function_kwargs):
+    """Decorator running a function as an XLA-compiled `tf.function`.
+
+    The function is only compiled when its first argument is a `Tensor`
+    with a statically known size of at least `_JIT_MIN_SIZE`, and otherwise
+    runs as uncompiled ops. It also runs uncompiled if running it compiled
+    fails while executing eagerly, as on devices that XLA does not support.
+
+    Creating the `tf.function` is deferred so that importing this module
+    does not force the lazy TensorFlow import to resolve.
+
+    Arguments:
+      **function_kwargs: Keyword arguments to pass to `tf.function`, in
+        addition to `jit_compile=True`.
+    """
+
+    def decorator(python_function):
+        tf_function = None
+
+        @functools.wraps(python_function)
+        def wrapper(data, *args):
+            nonlocal tf_function
+            size = data.shape.num_elements()
+            if size is None or size < _JIT_MIN_SIZE:
+                return python_function(data, *args)
+            if tf_function is None:
+                tf_function = tf.function(
+                    python_function, jit_compile=True, **function_kwargs
+                )
+            try:
+                return tf_function(data, *args)
+            except (
+                tf.errors.InvalidArgumentError,
+                tf.errors.NotFoundError,
+                tf.errors.UnimplementedError,
+            ):
+                # XLA could not compile the function, e.g. for a pluggable
+                # device that it does not support. In graph mode, this would
+                # only be raised when the graph runs, so is not caught here.
+                return python_function(data, *args)
+
+        return wrapper
+
+    return decorator
+
+
+@_lazy_jit_function(experimental_relax_shapes=True)
+def _reduce_min_max(data):
+    """Compute the minimum and maximum along the last axis of a `Tensor`.
+
+    Large data is compiled with XLA, which fuses both reductions into a
+    single pass over `data` rather than reading it once for each. The
+    results are returned as `float64`, whatever the type of `data`.
+    """
+    return (
+        tf.cast(tf.reduce_min(input_tensor=data, axis=-1), tf.float64),
+        tf.cast(tf.reduce_max(input_tensor=data, axis=-1), tf.float64),
+    )
+
+
+@_lazy_jit_function(experimental_relax_shapes=True)
+def _bucket_counts(data, min_, range_, bucket_count):
+    """Count values into equal-width buckets along the last axis of a `Tensor`.
+
+    Large data is compiled with XLA, which fuses the chain of elementwise
+    ops computing bucket indices into a single pass over `data` without
+    materializing intermediates, and accumulates counts directly into a
+    `bucket_count`-sized buffer per histogram.
+
+    Arguments:
+      data: A non-empty `Tensor` of type `float32` or `float64`. Bucket
+        indices are computed in this type.
+      min_: The `float64` minimum of `data` along its last axis.
+      range_: The (nonzero) `float64` difference between the extrema of
+        `data` along its last axis.
+      bucket_count: Positive `int` or scalar `int32` `Tensor`.
+
+    Returns:
+      A `float64` `Tensor` of shape `data.shape[:-1] + [bucket_count]`.
+    """
+    # Multiply by the reciprocal of the bucket width, computed once per
+    # histogram, rather than dividing every element by the width.
+    inv_width = tf.cast(
+        tf.cast(bucket_count, tf.float64) / range_, dtype=data.dtype
+    )
+    # This cast is exact, since `min_` is itself a value of `data`.
+    offsets = data - tf.cast(min_, dtype=data.dtype)[..., tf.newaxis]
+    bucket_indices = tf.cast(
+        tf.floor(offsets * inv_width[..., tf.newaxis]), dtype=tf.int32
+    )
+    # Clamp from below as well, so that NaN values in `data` (which can cast
+    # to negative indices) are not silently dropped by the segment sum.
+    clamped_indices = tf.clip_by_value(bucket_indices, 0, bucket_count - 1)
+    # Give each histogram its own run of `bucket_count` segments, so that
+    # all of them are counted by a single segment sum.
+    batch_shape = tf.shape(input=data)[:-1]
+    histogram_count = tf.reduce_prod(input_tensor=batch_shape)
+    first_segments = tf.reshape(
+        tf.range(histogram_count) * bucket_count,
+        tf.concat([batch_shape, [1]], 0),
+    )
+    # Sum into `bucket_count` segments rather than reducing a `[N,
+    # bucket_count]` one-hot matrix. Unlike `bincount`, whose output size
+    # depends on the data, this has a static output shape and so can be
+    # compiled by XLA. Accumulate in int64, which is exact, rather than in a
+    # floating point type, which would accumulate error when summing more
+    # than 2^24 individual `1.0` values in float32.
+    # See https://github.com/tensorflow/tensorflow/issues/51419 for details.
+    bucket_counts = tf.math.unsorted_segment_sum(
+        tf.ones_like(data, dtype=tf.int64),
+        clamped_indices + first_segments,
+        num_segments=histogram_count * bucket_count,
+    )
+    return tf.cast(
+        tf.reshape(bucket_counts, tf.concat([batch_shape, [bucket_count]], 0)),
+        dtype=tf.float64,
+    )
+
+
+def _histogram_fixed_width(data, min_, max_, bucket_count):
+    """Count values of a 1D `Tensor` into equal-width buckets.
+
+    For finite data, this has the same semantics as `_bucket_counts`, but
+    uses `tf.histogram_fixed_width`, whose GPU kernel accumulates counts in
+    per-block sub-histograms in shared memory rather than contending for
+    a single buffer. It has no XLA kernel, and so is called uncompiled,
+    and it only computes a single histogram.
+
+    Arguments:
+      data: A non-empty 1D `Tensor` of finite `float32` or `float64` values.
+      min_: The `float64` minimum of `data`, which must be finite.
+      max_: The `float64` maximum of `data`, which must be finite and
+        exceed `min_`.
+      bucket_count: Positive `int` or scalar `int32` `Tensor`.
+
+    Returns:
+      A `float64` `Tensor` of shape `[bucket_count]`.
+    """
+    # These casts are exact, since `min_` and `max_` are values of `data`.
+    value_range = tf.cast(tf.stack([min_, max_]), dtype=data.dtype)
+    # Values outside the range are counted in the first or last bucket, so
+    # in particular `max_` is counted in the last one. Count in `int32`,
+    # the only type for which the op has a GPU kernel; this is exact for up
+    # to 2^31 - 1 values per bucket.
+    bucket_counts = tf.histogram_fixed_width(
+        data, value_range, nbins=bucket_count
+    )
+    return tf.cast(bucket_counts, dtype=tf.float64)
+
+
 def histogram_pb(tag, data, buckets=None, description=None):
     """Create a histogram summary protobuf.
 
@@ -269,35 +710,34 @@ def histogram_pb(tag, data, buckets=None, description=None):
       A `summary_pb2.Summary` protobuf object.
     """
     bucket_count = DEFAULT_BUCKET_COUNT if buckets is None else buckets
-    data = np.array(data).flatten().astype(float)
+    data = np.asarray(data).ravel()
+    # Bucket single and half precision data in `float32`, which halves the
+    # memory traffic of each pass over it. The extrema, and so the edges,
+    # are still computed in `float64`.
+    if data.dtype in (np.float16, np.float32):
+        data = data.astype(np.float32, copy=False)
+    else:
+        data = data.astype(np.float64, copy=False)
     if data.size == 0:
         buckets = np.array([]).reshape((0, 3))
     else:
-        min_ = np.min(data)
-        max_ = np.max(data)
+        min_, max_ = _min_max(data)
         range_ = max_ - min_
         if range_ == 0:
             center = min_
             buckets = np.array([[center - 0.5, center + 0.5, float(data.size)]])
         else:
-            bucket_width = range_ / bucket_count
-            offsets = data - min_
-            bucket_indices = np.floor(offsets / bucket_width).astype(int)
-            clamped_indices = np.minimum(bucket_indices, bucket_count - 1)
-            one_hots = np.array([clamped_indices]).transpose() == np.arange(
-                0, bucket_count
-            )  # broadcast
-            assert one_hots.shape == (data.size, bucket_count), (
-                one_hots.shape,
-                (data.size, bucket_count),
+            # Fill each column of the row-major output buffer in place,
+            # rather than building edge and count arrays and stacking them.
+            buckets = np.empty((bucket_count, 3), dtype=np.float64)
+            left_edges = buckets[:, 0]
+            np.multiply(
+                np.arange(bucket_count), range_ / bucket_count, out=left_edges
             )
-            bucket_counts = np.sum(one_hots, axis=0)
-            edges = np.linspace(min_, max_, bucket_count + 1)
-            left_edges = edges[:-1]
-            right_edges = edges[1:]
-            buckets = np.array(
-                [left_edges, right_edges, bucket_counts]
-            ).transpose()
+            left_edges += min_
+            buckets[:-1, 1] = left_edges[1:]
+            buckets[-1, 1] = max_
+            buckets[:, 2] = _count_buckets(data, min_, max_, bucket_count)
     tensor = tensor_util.make_tensor_proto(buckets, dtype=np.float64)
 
     summary_metadata = metadata.create_summary_metadata(
@@ -306,3 +746,109 @@ def histogram_pb(tag, data, buckets=None, description=None):
     summary = summary_pb2.Summary()
     summary.value.add(tag=tag, metadata=summary_metadata, tensor=tensor)
     return summary
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numba_histogram():
+    """Import the `numba` histogram kernels, if `numba` is installed.
+
+    Importing `numba` is slow, so this is deferred until the kernels are
+    first needed rather than done when this module is imported.
+
+    Returns:
+      The `_numba_histogram` module, or `None` if it cannot be imported.
+    """
+    try:
+        from tensorboard.plugins.histogram import _numba_histogram
+    except ImportError:
+        return None
+    return _numba_histogram
+
+
+def _min_max(data):
+    """Compute the minimum and maximum of a non-empty 1D `np.array`.
+
+    Returns:
+      A pair of Python `float`s, whatever the type of `data`.
+    """
+    if data.size >= _ACCELERATED_MIN_SIZE:
+        numba_histogram = _import_numba_histogram()
+        if numba_histogram is not None:
+            min_, max_ = numba_histogram.min_max(data)
+            return float(min_), float(max_)
+    # Reduce each chunk to both extrema while it is in cache, rather than
+    # reading all of `data` once per reduction.
+    chunk_mins = []
+    chunk_maxs = []
+    for start in range(0, data.size, _CHUNK_SIZE):
+        chunk = data[start : start + _CHUNK_SIZE]
+        chunk_mins.append(np.min(chunk))
+        chunk_maxs.append(np.max(chunk))
+    return float(np.min(chunk_mins)), float(np.max(chunk_maxs))
+
+
+def _count_buckets(data, min_, max_, bucket_count):
+    """Count values into equal-width buckets spanning `[min_, max_]`.
+
+    Each bucket is half-open on the right, except for the last bucket,
+    which also includes `max_`.
+
+    Arguments:
+      data: A non-empty 1D `np.array` of type `float32` or `float64`.
+        Bucket indices are computed in this type.
+      min_: The minimum value of `data`.
+      max_: The maximum value of `data`, which must exceed `min_`.
+      bucket_count: Positive `int` number of buckets.
+
+    Returns:
+      A `np.array` of shape `[bucket_count]` and type `float64`.
+    """
+    if data.size >= _ACCELERATED_MIN_SIZE:
+        numba_histogram = _import_numba_histogram()
+        if numba_histogram is not None:
+            return numba_histogram.bucket_counts(
+                data, min_, max_, bucket_count
+            ).astype(np.float64)
+        # `fast_histogram` rejects a non-finite range, as arises when `data`
+        # has NaNs or infinities, so leave those to the NumPy code below.
+        if (
+            _fast_histogram1d is not None
+            and np.isfinite(min_)
+            and np.isfinite(max_)
+        ):
+            bucket_counts = _fast_histogram1d(
+                data, bins=bucket_count, range=(min_, max_)
+            )
+            # `fast_histogram` treats its range as half-open and so drops
+            # values equal to `max_`, which belong in our last bucket.
+            bucket_counts[-1] += np.count_nonzero(data == max_)
+            return bucket_counts
+    # Compute bucket indices one chunk at a time, in place in scratch
+    # buffers that are reused across chunks and so stay in cache. Multiply
+    # by the reciprocal of the bucket width once rather than dividing every
+    # element by it.
+    range_ = max_ - min_
+    inv_width = bucket_count / range_
+    # Offsets from `min_` overflow `float32` when the range is wider than its
+    # maximum, so compute them in `float64` then.
+    if range_ > float(np.finfo(data.dtype).max):
+        scratch_dtype = np.float64
+    else:
+        scratch_dtype = data.dtype
+    scratch = np.empty(min(data.size, _CHUNK_SIZE), dtype=scratch_dtype)
+    index_scratch = np.empty(scratch.shape, dtype=np.intp)
+    bucket_counts = np.zeros(bucket_count, dtype=np.int64)
+    for start in range(0, data.size, _CHUNK_SIZE):
+        chunk = data[start : start + _CHUNK_SIZE]
+        offsets = scratch[: chunk.size]
+        np.subtract(chunk, min_, out=offsets, dtype=offsets.dtype)
+        np.multiply(offsets, inv_width, out=offsets)
+        np.floor(offsets, out=offsets)
+        # Clamp from below as well, since `np.bincount` rejects negative
+        # indices. Use `fmax` so that NaN values also map to bucket 0.
+        np.fmax(offsets, 0, out=offsets)
+        np.minimum(offsets, bucket_count - 1, out=offsets)
+        clamped_indices = index_scratch[: chunk.size]
+        np.copyto(clamped_indices, offsets, casting="unsafe")
+        bucket_counts += np.bincount(clamped_indices, minlength=bucket_count)
+    return bucket_counts.astype(np.float64)